@@ -1,5 +1,5 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Depends, Query
+from typing import Dict, Any, Optional
 import sys
 import os
 import uuid
@@ -9,6 +9,7 @@ from svc.db import AsyncSessionLocal
 from svc.models import TranscriptionRequest, RequestStatus, User, Organization
 from svc.analyse_file_svc import AnalyseFileService
 from svc.auth_utils import get_current_user
+from svc.transcript_store import pack_words, PackedWords
 
 router = APIRouter(prefix="/api/v1", tags=["Audio Analysis"])
 
@@ -25,8 +26,9 @@ async def process_transcription(request_id: str, file_content: bytes, filename:
         await session.commit()
         try:
             result = await analyse_service.transcribe_audio_file(file_content, filename)
-            transcript = result['results']['channels'][0]['alternatives'][0]['transcript']
-            req.transcript = transcript
+            alternative = result['results']['channels'][0]['alternatives'][0]
+            req.transcript = alternative['transcript']
+            req.words = pack_words(alternative.get('words', []))
             review_result = await analyse_service.review_transcript(req.transcript, request_id=request_id)
             req.result = review_result.get("result")
             req.error = None
@@ -144,4 +146,41 @@ async def soft_delete_transcript(request_id: str, current_user: User = Depends(g
         transcript.status = "deleted"
         await session.commit()
         return {"message": "Transcript deleted (soft)"}
-        
+
+async def get_packed_words(request_id: str, current_user: User) -> PackedWords:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(TranscriptionRequest)
+            .where(TranscriptionRequest.request_id == request_id)
+        )
+        transcript = result.scalar_one_or_none()
+        if not transcript or transcript.status == RequestStatus.deleted:
+            raise HTTPException(status_code=404, detail="Transcript not found")
+        # Only creator or org owner can read word timings
+        is_owner = current_user.is_org_owner and (current_user.organization_id == transcript.organization_id)
+        is_creator = (transcript.created_by == current_user.id)
+        if not (is_owner or is_creator):
+            raise HTTPException(status_code=403, detail="Not authorized to view this transcript")
+        if transcript.words is None:
+            raise HTTPException(status_code=404, detail="Word timings not available for this transcript")
+        return PackedWords(transcript.words)
+
+@router.get("/transcript/{request_id}/words")
+async def get_transcript_words(
+    request_id: str,
+    start: float = Query(0.0, ge=0, description="Window start in seconds"),
+    end: Optional[float] = Query(None, ge=0, description="Window end in seconds, defaults to end of audio"),
+    current_user: User = Depends(get_current_user)
+):
+    packed = await get_packed_words(request_id, current_user)
+    words = packed.time_slice(start, end)
+    return {"request_id": request_id, "words": words}
+
+@router.get("/transcript/{request_id}/turns")
+async def get_transcript_turns(
+    request_id: str,
+    speaker: Optional[int] = Query(None, ge=0, description="Only return turns for this speaker"),
+    current_user: User = Depends(get_current_user)
+):
+    packed = await get_packed_words(request_id, current_user)
+    return {"request_id": request_id, "turns": packed.speaker_turns(speaker)}
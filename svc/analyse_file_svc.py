@@ -58,6 +58,7 @@ class AnalyseFileService:
             params = {
                 "model": "nova-3",
                 "smart_format": "true",
+                "diarize": "true",
                 "language": "multi"
             }
             
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, Enum, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, DateTime, Enum, ForeignKey, Boolean, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID, JSONB, UUID as PG_UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, relationship
@@ -20,6 +20,7 @@ class TranscriptionRequest(Base):
     request_id: Mapped[str] = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
     filename: Mapped[str] = Column(String(256), nullable=False)
     transcript: Mapped[str] = Column(Text, nullable=True)
+    words: Mapped[bytes] = Column(LargeBinary, nullable=True)  # packed word timings, see svc/transcript_store.py
     status: Mapped[str] = Column(Enum(RequestStatus), default=RequestStatus.pending, nullable=False)
     created_at: Mapped[str] = Column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[str] = Column(DateTime(timezone=True), onupdate=func.now())
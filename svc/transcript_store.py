@@ -0,0 +1,154 @@
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, List, Optional
+
+# Packed word-timing layout:
+#   magic (4 bytes) | word count (uint32) | 5 x compressed column length (uint32)
+#   followed by the zlib-compressed columns in the order below.
+# Every column is a little-endian packed array, so a time slice or speaker lookup
+# only inflates the columns it needs instead of parsing Deepgram's raw JSON.
+MAGIC = b"VAW1"
+HEADER = struct.Struct("<4sI5I")
+
+COL_START = 0       # word start, milliseconds (uint32)
+COL_END = 1         # word end, milliseconds (uint32)
+COL_CONFIDENCE = 2  # confidence scaled to 0-255 (uint8)
+COL_SPEAKER = 3     # diarized speaker id (uint16), NO_SPEAKER when missing
+COL_WORDS = 4       # punctuated words joined by "\n" (utf-8)
+
+NO_SPEAKER = 0xFFFF
+
+_TYPECODES = {COL_START: "I", COL_END: "I", COL_CONFIDENCE: "B", COL_SPEAKER: "H"}
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, raw: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def pack_words(words: List[Dict[str, Any]]) -> bytes:
+    """
+    Pack Deepgram word entries into a compact columnar blob
+
+    Args:
+        words: `alternatives[0].words` from a Deepgram response
+
+    Returns:
+        Binary blob suitable for TranscriptionRequest.words
+    """
+    starts = array("I")
+    ends = array("I")
+    confidences = array("B")
+    speakers = array("H")
+    tokens = []
+    for w in words:
+        starts.append(int(round(w.get("start", 0.0) * 1000)))
+        ends.append(int(round(w.get("end", 0.0) * 1000)))
+        confidence = min(max(w.get("confidence", 0.0), 0.0), 1.0)
+        confidences.append(int(round(confidence * 255)))
+        speaker = w.get("speaker")
+        speakers.append(NO_SPEAKER if speaker is None else int(speaker))
+        tokens.append((w.get("punctuated_word") or w.get("word", "")).replace("\n", " "))
+
+    columns = [
+        zlib.compress(_to_bytes(starts), 9),
+        zlib.compress(_to_bytes(ends), 9),
+        zlib.compress(_to_bytes(confidences), 9),
+        zlib.compress(_to_bytes(speakers), 9),
+        zlib.compress("\n".join(tokens).encode("utf-8"), 9),
+    ]
+    header = HEADER.pack(MAGIC, len(tokens), *(len(c) for c in columns))
+    return header + b"".join(columns)
+
+
+class PackedWords:
+    """Lazy reader over a blob produced by pack_words; columns are inflated on first use."""
+
+    def __init__(self, blob: bytes):
+        if not blob or len(blob) < HEADER.size:
+            raise ValueError("Word timing data is empty or truncated")
+        magic, count, *lengths = HEADER.unpack_from(blob)
+        if magic != MAGIC:
+            raise ValueError("Unrecognised word timing format")
+        self.count = count
+        self._blob = blob
+        self._offsets = []
+        offset = HEADER.size
+        for length in lengths:
+            self._offsets.append((offset, offset + length))
+            offset += length
+        if offset > len(blob):
+            raise ValueError("Word timing data is empty or truncated")
+        self._cache: Dict[int, Any] = {}
+
+    def _column(self, col: int):
+        if col not in self._cache:
+            begin, end = self._offsets[col]
+            raw = zlib.decompress(self._blob[begin:end])
+            if col == COL_WORDS:
+                self._cache[col] = raw.decode("utf-8").split("\n") if self.count else []
+            else:
+                self._cache[col] = _from_bytes(_TYPECODES[col], raw)
+        return self._cache[col]
+
+    def _word(self, i: int) -> Dict[str, Any]:
+        speaker = self._column(COL_SPEAKER)[i]
+        return {
+            "word": self._column(COL_WORDS)[i],
+            "start": self._column(COL_START)[i] / 1000,
+            "end": self._column(COL_END)[i] / 1000,
+            "confidence": round(self._column(COL_CONFIDENCE)[i] / 255, 3),
+            "speaker": None if speaker == NO_SPEAKER else speaker,
+        }
+
+    def time_slice(self, start: float, end: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Return words overlapping the [start, end] window in seconds; open-ended when end is None"""
+        # Deepgram emits words in time order, so both columns are sorted.
+        first = bisect_left(self._column(COL_END), int(round(start * 1000)))
+        if end is None:
+            last = self.count
+        else:
+            last = bisect_right(self._column(COL_START), int(round(end * 1000)))
+        return [self._word(i) for i in range(first, last)]
+
+    def speaker_turns(self, speaker: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Group consecutive words by speaker
+
+        Args:
+            speaker: Only return turns for this speaker id; all speakers when None
+
+        Returns:
+            List of turns with speaker, start, end and text
+        """
+        speakers = self._column(COL_SPEAKER)
+        turns = []
+        i = 0
+        while i < self.count:
+            current = speakers[i]
+            j = i
+            while j + 1 < self.count and speakers[j + 1] == current:
+                j += 1
+            if speaker is None or current == speaker:
+                words = self._column(COL_WORDS)
+                turns.append({
+                    "speaker": None if current == NO_SPEAKER else current,
+                    "start": self._column(COL_START)[i] / 1000,
+                    "end": self._column(COL_END)[j] / 1000,
+                    "text": " ".join(words[i:j + 1]),
+                })
+            i = j + 1
+        return turns